@@ -5,19 +5,138 @@ This script connects via AWS SSO and performs read-only operations.
 """
 
 import argparse
+import asyncio
 import boto3
 import csv
+import json
+import os
+import random
+import re
 import sys
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from datetime import datetime
+from botocore.config import Config
 from botocore.exceptions import ClientError, NoCredentialsError
 
+# Optional dependency for --async mode; the threaded path needs only boto3.
+try:
+    import aioboto3
+except ImportError:
+    aioboto3 = None
+
+
+# Dry-run fixtures, built once at import. Plain dicts rather than read-only
+# proxies: the accounts must pickle cleanly for --executor process.
+MOCK_ACCOUNTS = (
+    {
+        'id': '987654321098',
+        'name': 'Production-GovCloud',
+        'email': 'govcloud-prod@example.com',
+        'status': 'ACTIVE'
+    },
+    {
+        'id': '876543210987',
+        'name': 'Development-GovCloud',
+        'email': 'govcloud-dev@example.com',
+        'status': 'ACTIVE'
+    },
+    {
+        'id': '765432109876',
+        'name': 'Test-GovCloud',
+        'email': 'govcloud-test@example.com',
+        'status': 'ACTIVE'
+    }
+)
+
+MOCK_FSX_SYSTEMS = (
+    {
+        'filesystem_id': 'fs-0123456789abcdef0',
+        'filesystem_type': 'LUSTRE',
+        'region': 'us-gov-west-1',
+        'creation_time': '2024-01-15',
+        'lifecycle': 'AVAILABLE'
+    },
+    {
+        'filesystem_id': 'fs-abcdef0123456789',
+        'filesystem_type': 'WINDOWS',
+        'region': 'us-gov-west-1',
+        'creation_time': '2024-02-20',
+        'lifecycle': 'AVAILABLE'
+    }
+)
+
+
+def _quote_csv_field(value):
+    """
+    Quote a single CSV field per RFC 4180 when it needs quoting.
+
+    Args:
+        value: Field value (stringified if not already a string)
+
+    Returns:
+        str: The field, quoted and escaped if it contains a delimiter,
+        quote, or newline
+    """
+    value = str(value)
+    if any(ch in value for ch in ',"\r\n'):
+        return '"' + value.replace('"', '""') + '"'
+    return value
+
+
+def _compile_row_writer():
+    """
+    Generate a row writer specialized for the fixed six-column CSV schema.
+
+    The schema never changes at runtime, so a format string baked in via
+    exec beats csv.writer's generic per-field dialect handling. Only the
+    first two columns (account name and ID, free-form org data) go through
+    the quoting helper; FSX IDs, types, regions, and lifecycle states are
+    CSV-safe by AWS format.
+
+    Returns:
+        callable: write_rows(f, rows) writing an iterable of six-tuples
+    """
+    params = ['a', 'b', 'c', 'd', 'e', 'g']
+    fields = ['{q(%s)}' % p if i < 2 else '{%s}' % p
+              for i, p in enumerate(params)]
+    source = (
+        "def write_rows(f, rows):\n"
+        "    f.write(''.join([f'%s\\r\\n' for (%s) in rows]))\n"
+        % (','.join(fields), ', '.join(params))
+    )
+    namespace = {'q': _quote_csv_field}
+    exec(source, namespace)
+    return namespace['write_rows']
+
 
 class GovCloudFSXInventory:
     """
     Class to manage FSX inventory collection from GovCloud accounts.
     """
 
-    def __init__(self, profile_name=None, dry_run=False, role_name='OrganizationAccountAccessRole'):
+    # Account lists change rarely; cache them on disk so repeated runs skip
+    # the (throttling-prone) Organizations API entirely.
+    ACCOUNTS_CACHE_FILE = os.path.expanduser('~/.cache/govcloud_fsx/accounts.json')
+    ACCOUNTS_CACHE_TTL = 24 * 60 * 60  # seconds
+
+    CSV_FIELDNAMES = ['Organization Name', 'GovCloud Account ID', 'FSX ID',
+                      'FSX Type', 'Region', 'Lifecycle']
+
+    # Matching with a compiled case-insensitive pattern avoids allocating a
+    # lowercased copy of every account name and email in large orgs.
+    _GOV_RE = re.compile(r'govcloud', re.IGNORECASE)
+
+    # Organizations and STS are well-known throttling hot spots once the
+    # scan is fanned out across threads.
+    THROTTLING_ERROR_CODES = ('Throttling', 'ThrottlingException', 'TooManyRequestsException')
+    MAX_THROTTLE_RETRIES = 4
+
+    def __init__(self, profile_name=None, dry_run=False, role_name='OrganizationAccountAccessRole',
+                 max_workers=16, refresh_accounts=False, executor='thread',
+                 prewarm_credentials=False, accounts_source='api',
+                 accounts_table='cf-cache', accounts_file=None, use_async=False):
         """
         Initialize the inventory manager.
 
@@ -25,12 +144,89 @@ class GovCloudFSXInventory:
             profile_name: AWS CLI profile name to use (optional)
             dry_run: If True, simulates operations without making actual AWS API calls
             role_name: IAM role name to assume in target accounts
+            max_workers: Number of accounts to scan concurrently
+            refresh_accounts: If True, ignore the on-disk account cache
+            executor: 'thread' (default) or 'process'; process workers get a
+                fully isolated credential chain at the cost of more overhead
+            prewarm_credentials: If True, resolve each assumed session's
+                credentials serially right after AssumeRole
+            accounts_source: Where to read the account list from: 'api'
+                (Organizations, default), 'dynamodb', or 'file'; the
+                non-api sources fall back to the API when empty
+            accounts_table: DynamoDB table name for accounts_source='dynamodb'
+            accounts_file: JSON or CSV path for accounts_source='file'
+            use_async: If True, scan accounts on an asyncio event loop via
+                aioboto3 instead of the thread pool (requires aioboto3)
         """
         self.profile_name = profile_name
         self.dry_run = dry_run
         self.role_name = role_name
+        self.max_workers = max_workers
+        self.refresh_accounts = refresh_accounts
+        self.executor = executor
+        self.prewarm_credentials = prewarm_credentials
+        self.accounts_source = accounts_source
+        self.accounts_table = accounts_table
+        self.accounts_file = accounts_file
+        self.use_async = use_async
         self.session = None
         self.govcloud_regions = ['us-gov-west-1', 'us-gov-east-1']
+        self._print_lock = threading.Lock()
+        self._sts_client = None
+        self._session_cache = {}
+        self._session_cache_lock = threading.Lock()
+        self._prewarm_lock = threading.Lock()
+        self._in_govcloud = False
+        self._nogov_accounts = set()
+        self._write_rows = _compile_row_writer()
+
+        # Shared client config: the default pool of 10 connections would
+        # serialize threaded calls, and keepalive/retry tuning avoids paying
+        # a TLS handshake (or a failed run) per throttled request. Keep the
+        # pool at least max_workers * len(govcloud_regions) so no worker
+        # blocks waiting for a connection.
+        self._botocore_config = Config(
+            max_pool_connections=max(64, max_workers * len(self.govcloud_regions)),
+            tcp_keepalive=True,
+            retries={'mode': 'adaptive', 'max_attempts': 10},
+            connect_timeout=5,
+            read_timeout=30
+        )
+
+    def _print(self, *lines):
+        """
+        Print one or more log lines atomically.
+
+        Worker threads share stdout, so grouping an account's output under a
+        lock keeps interleaved log lines readable.
+        """
+        with self._print_lock:
+            for line in lines:
+                print(line)
+
+    def _with_backoff(self, call, *args, **kwargs):
+        """
+        Invoke an API call, retrying throttling errors with jittered backoff.
+
+        Supplements the adaptive retry mode in the client Config: once
+        botocore's own retries are exhausted, back off at the application
+        level instead of failing the whole scan.
+
+        Args:
+            call: Callable making the API request
+            *args, **kwargs: Passed through to the callable
+
+        Returns:
+            The callable's return value
+        """
+        for attempt in range(self.MAX_THROTTLE_RETRIES + 1):
+            try:
+                return call(*args, **kwargs)
+            except ClientError as e:
+                if (e.response['Error']['Code'] not in self.THROTTLING_ERROR_CODES or
+                        attempt == self.MAX_THROTTLE_RETRIES):
+                    raise
+                time.sleep(random.uniform(0, 2 ** attempt))
 
     def connect(self):
         """
@@ -45,16 +241,41 @@ class GovCloudFSXInventory:
             return True
 
         try:
+            # Prefer regional STS endpoints over the legacy global one:
+            # fewer DNS hops and the connection stays reusable in-region.
+            os.environ.setdefault('AWS_STS_REGIONAL_ENDPOINTS', 'regional')
+
             if self.profile_name:
                 self.session = boto3.Session(profile_name=self.profile_name)
             else:
                 self.session = boto3.Session()
 
-            # Test credentials by making a simple API call
-            sts = self.session.client('sts')
-            identity = sts.get_caller_identity()
+            # Test credentials by making a simple API call, and keep the
+            # client around: constructing one costs ~25 ms of endpoint and
+            # model loading, which adds up across hundreds of AssumeRoles.
+            self._sts_client = self.session.client('sts', config=self._botocore_config)
+            identity = self._sts_client.get_caller_identity()
+
+            # A GovCloud management account's Organization only contains
+            # GovCloud accounts, so list_accounts can skip name filtering.
+            self._in_govcloud = identity['Arn'].startswith('arn:aws-us-gov:')
+
             print(f"✓ Connected as: {identity['Arn']}")
             print(f"✓ Account: {identity['Account']}")
+            if self._in_govcloud:
+                print("✓ Partition: aws-us-gov (all org accounts are GovCloud)")
+
+                # AssumeRole against aws-us-gov role ARNs must go through a
+                # GovCloud STS endpoint; pin the shared client to the
+                # regional one, which all assume_role calls reuse.
+                sts_region = self.govcloud_regions[0]
+                self._sts_client.close()
+                self._sts_client = self.session.client(
+                    'sts',
+                    region_name=sts_region,
+                    endpoint_url=f'https://sts.{sts_region}.amazonaws.com',
+                    config=self._botocore_config
+                )
             return True
 
         except NoCredentialsError:
@@ -67,66 +288,207 @@ class GovCloudFSXInventory:
             print(f"ERROR: Failed to authenticate: {e}")
             return False
 
+    def _load_cached_accounts(self, org_id):
+        """
+        Load the cached account list for an organization, if still fresh.
+
+        Args:
+            org_id: Organization ID the cache entry must match
+
+        Returns:
+            list or None: Cached account dictionaries, or None on miss/expiry
+        """
+        try:
+            with open(self.ACCOUNTS_CACHE_FILE) as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if cached.get('org_id') != org_id:
+            return None
+        if time.time() - cached.get('fetched_at', 0) > self.ACCOUNTS_CACHE_TTL:
+            return None
+
+        return cached.get('accounts')
+
+    def _save_cached_accounts(self, org_id, accounts):
+        """
+        Write the account list to the on-disk cache.
+
+        Args:
+            org_id: Organization ID to key the cache entry by
+            accounts: List of account dictionaries to store
+        """
+        try:
+            os.makedirs(os.path.dirname(self.ACCOUNTS_CACHE_FILE), exist_ok=True)
+            with open(self.ACCOUNTS_CACHE_FILE, 'w') as f:
+                json.dump({
+                    'org_id': org_id,
+                    'fetched_at': time.time(),
+                    'accounts': accounts
+                }, f)
+        except OSError:
+            pass  # Caching is best-effort; never fail the scan over it
+
+    @staticmethod
+    def _normalize_account(record):
+        """
+        Map an external account record onto the internal account dict shape.
+
+        Accepts either this script's lowercase keys or the Organizations
+        API's capitalized ones (as stored by account-cache tables).
+
+        Args:
+            record: Mapping with account fields under either key style
+
+        Returns:
+            dict: Account dict with id/name/email/status keys
+        """
+        return {
+            'id': record.get('id') or record.get('Id', ''),
+            'name': record.get('name') or record.get('Name', ''),
+            'email': record.get('email') or record.get('Email', ''),
+            'status': record.get('status') or record.get('Status', 'UNKNOWN')
+        }
+
+    def _load_accounts_dynamodb(self):
+        """
+        Read the account list from a pre-populated DynamoDB cache table.
+
+        Orgs that maintain an account inventory table (e.g. fed by a
+        Config/Organizations pipeline) can serve the list from one Scan
+        instead of paging the rate-limited Organizations API.
+
+        Returns:
+            list: Account dictionaries for ACTIVE accounts, or [] on failure
+        """
+        try:
+            table = self.session.resource('dynamodb').Table(self.accounts_table)
+
+            items = []
+            scan_kwargs = {}
+            while True:
+                response = self._with_backoff(table.scan, **scan_kwargs)
+                items.extend(response.get('Items', []))
+                if 'LastEvaluatedKey' not in response:
+                    break
+                scan_kwargs['ExclusiveStartKey'] = response['LastEvaluatedKey']
+
+            return [
+                account
+                for account in (self._normalize_account(item) for item in items)
+                if account['id'] and account['status'] == 'ACTIVE'
+            ]
+
+        except ClientError as e:
+            print(f"  ⚠ Could not read accounts from table {self.accounts_table}: "
+                  f"{e.response['Error']['Code']}")
+            return []
+
+    def _load_accounts_file(self):
+        """
+        Read the account list from a local JSON or CSV file.
+
+        Returns:
+            list: Account dictionaries for ACTIVE accounts, or [] on failure
+        """
+        try:
+            with open(self.accounts_file, newline='') as f:
+                if self.accounts_file.endswith('.json'):
+                    records = json.load(f)
+                else:
+                    records = list(csv.DictReader(f))
+        except (OSError, ValueError) as e:
+            print(f"  ⚠ Could not read accounts from {self.accounts_file}: {e}")
+            return []
+
+        return [
+            account
+            for account in (self._normalize_account(record) for record in records)
+            if account['id'] and account['status'] == 'ACTIVE'
+        ]
+
     def list_accounts(self):
         """
         List all accounts in the AWS Organization.
 
+        Results are cached on disk for ACCOUNTS_CACHE_TTL seconds, keyed by
+        organization ID, so repeated runs skip the Organizations API. Pass
+        --refresh-accounts to force a refetch.
+
         Returns:
             list: List of dictionaries containing account info
         """
         if self.dry_run:
             print("\n→ [DRY-RUN] Would list accounts in organization...")
             print("  [DRY-RUN] API Call: organizations.list_accounts()")
-            mock_accounts = [
-                {
-                    'id': '987654321098',
-                    'name': 'Production-GovCloud',
-                    'email': 'govcloud-prod@example.com',
-                    'status': 'ACTIVE'
-                },
-                {
-                    'id': '876543210987',
-                    'name': 'Development-GovCloud',
-                    'email': 'govcloud-dev@example.com',
-                    'status': 'ACTIVE'
-                },
-                {
-                    'id': '765432109876',
-                    'name': 'Test-GovCloud',
-                    'email': 'govcloud-test@example.com',
-                    'status': 'ACTIVE'
-                }
-            ]
-            print(f"✓ [DRY-RUN] Would find {len(mock_accounts)} account(s)")
-            for acc in mock_accounts:
+            print(f"✓ [DRY-RUN] Would find {len(MOCK_ACCOUNTS)} account(s)")
+            for acc in MOCK_ACCOUNTS:
                 print(f"  - {acc['name']} ({acc['id']})")
-            return mock_accounts
-
-        org_client = self.session.client('organizations')
-        accounts = []
+            return MOCK_ACCOUNTS
+
+        if self.accounts_source == 'dynamodb':
+            print(f"\n→ Reading accounts from DynamoDB table {self.accounts_table}...")
+            accounts = self._load_accounts_dynamodb()
+            if accounts:
+                print(f"✓ Found {len(accounts)} account(s)")
+                return accounts
+            print("  ⚠ No accounts from DynamoDB; falling back to the Organizations API")
+
+        elif self.accounts_source == 'file':
+            print(f"\n→ Reading accounts from {self.accounts_file}...")
+            accounts = self._load_accounts_file()
+            if accounts:
+                print(f"✓ Found {len(accounts)} account(s)")
+                return accounts
+            print("  ⚠ No accounts from file; falling back to the Organizations API")
+
+        org_client = self.session.client('organizations', config=self._botocore_config)
 
         try:
             print("\n→ Listing accounts in organization...")
+
+            # The on-disk cache is keyed by org ID, but DescribeOrganization
+            # is not part of the script's minimum Organizations policy; fall
+            # back to an uncached listing when it is denied.
+            org_id = None
+            try:
+                org_id = self._with_backoff(org_client.describe_organization)['Organization']['Id']
+            except ClientError as e:
+                if e.response['Error']['Code'] != 'AccessDeniedException':
+                    raise
+                print("  ℹ No organizations:DescribeOrganization permission; "
+                      "skipping the account cache")
+
+            if org_id and not self.refresh_accounts:
+                accounts = self._load_cached_accounts(org_id)
+                if accounts is not None:
+                    print(f"✓ Found {len(accounts)} account(s) (cached)")
+                    return accounts
+
             paginator = org_client.get_paginator('list_accounts')
+            result = self._with_backoff(paginator.paginate().build_full_result)
 
-            for page in paginator.paginate():
-                for account in page['Accounts']:
-                    account_name = account.get('Name', '')
-                    account_email = account.get('Email', '')
-                    account_id = account['Id']
-
-                    # Filter for GovCloud accounts or all active accounts
-                    # Adjust this logic based on your organization's naming conventions
-                    if ('govcloud' in account_name.lower() or
-                        'govcloud' in account_email.lower() or
-                        account.get('Status') == 'ACTIVE'):
-
-                        accounts.append({
-                            'id': account_id,
-                            'name': account_name,
-                            'email': account_email,
-                            'status': account.get('Status', 'UNKNOWN')
-                        })
+            # Filter for GovCloud accounts or all active accounts. When the
+            # management account is already in GovCloud the name checks are
+            # redundant — every account in the org is a GovCloud account.
+            # Adjust this logic based on your organization's naming conventions
+            accounts = [
+                {
+                    'id': account['Id'],
+                    'name': account.get('Name', ''),
+                    'email': account.get('Email', ''),
+                    'status': account.get('Status', 'UNKNOWN')
+                }
+                for account in result['Accounts']
+                if (account.get('Status') == 'ACTIVE' or
+                    (not self._in_govcloud and
+                     (self._GOV_RE.search(account.get('Name', '')) or
+                      self._GOV_RE.search(account.get('Email', '')))))
+            ]
+
+            if org_id:
+                self._save_cached_accounts(org_id, accounts)
 
             print(f"✓ Found {len(accounts)} account(s)")
             return accounts
@@ -150,14 +512,25 @@ class GovCloudFSXInventory:
             boto3.Session or None: Session for the assumed role, or None if failed
         """
         if self.dry_run:
-            print(f"  [DRY-RUN] Would assume role: arn:aws-us-gov:iam::{account_id}:role/{self.role_name}")
+            self._print(f"  [DRY-RUN] Would assume role: arn:aws-us-gov:iam::{account_id}:role/{self.role_name}")
             return 'mock_session'  # Return a mock session indicator
 
+        # Re-entrant calls (e.g. retries) should not re-issue AssumeRole,
+        # and accounts that already failed (commercial accounts with no
+        # GovCloud role) should fail fast instead of paying the round-trip
+        # again.
+        with self._session_cache_lock:
+            if account_id in self._nogov_accounts:
+                return None
+            cached_session = self._session_cache.get(account_id)
+        if cached_session:
+            return cached_session
+
         try:
-            sts_client = self.session.client('sts')
             role_arn = f"arn:aws-us-gov:iam::{account_id}:role/{self.role_name}"
 
-            response = sts_client.assume_role(
+            response = self._with_backoff(
+                self._sts_client.assume_role,
                 RoleArn=role_arn,
                 RoleSessionName=f'fsx-inventory-{account_id}'
             )
@@ -169,10 +542,31 @@ class GovCloudFSXInventory:
                 aws_session_token=credentials['SessionToken']
             )
 
+            if self.prewarm_credentials:
+                # Resolve the new session's credentials before handing it to
+                # concurrent region workers; botocore's first-use credential
+                # resolution is the one step that can race across threads.
+                # The lock only serializes this initial resolve.
+                with self._prewarm_lock:
+                    prewarm_sts = assumed_session.client(
+                        'sts',
+                        region_name=self.govcloud_regions[0],
+                        config=self._botocore_config
+                    )
+                    try:
+                        prewarm_sts.get_caller_identity()
+                    finally:
+                        prewarm_sts.close()
+
+            with self._session_cache_lock:
+                self._session_cache[account_id] = assumed_session
+
             return assumed_session
 
         except ClientError as e:
-            print(f"  ⚠ Cannot assume role in account {account_id}: {e.response['Error']['Code']}")
+            with self._session_cache_lock:
+                self._nogov_accounts.add(account_id)
+            self._print(f"  ⚠ Cannot assume role in account {account_id}: {e.response['Error']['Code']}")
             return None
 
     def list_fsx_systems(self, session, account_info):
@@ -187,143 +581,308 @@ class GovCloudFSXInventory:
             list: List of FSX file system details
         """
         if self.dry_run:
-            print(f"  [DRY-RUN] Would query FSX in regions: {', '.join(self.govcloud_regions)}")
-            mock_fsx = [
-                {
-                    'filesystem_id': 'fs-0123456789abcdef0',
-                    'filesystem_type': 'LUSTRE',
-                    'region': 'us-gov-west-1',
-                    'creation_time': '2024-01-15',
-                    'lifecycle': 'AVAILABLE'
-                },
-                {
-                    'filesystem_id': 'fs-abcdef0123456789',
-                    'filesystem_type': 'WINDOWS',
-                    'region': 'us-gov-west-1',
-                    'creation_time': '2024-02-20',
-                    'lifecycle': 'AVAILABLE'
-                }
-            ]
-            print(f"  ✓ [DRY-RUN] Would find {len(mock_fsx)} FSX system(s)")
-            return mock_fsx
+            self._print(f"  [DRY-RUN] Would query FSX in regions: {', '.join(self.govcloud_regions)}")
+            self._print(f"  ✓ [DRY-RUN] Would find {len(MOCK_FSX_SYSTEMS)} FSX system(s)")
+            return MOCK_FSX_SYSTEMS
+
+        def _list_region(region):
+            # Each worker builds its own fsx client from the shared session;
+            # boto3 clients are safe to use once created per thread.
+            def _collect():
+                # build_full_result merges the pages in botocore; projecting
+                # only the needed keys in one comprehension drops the bulky
+                # unused response fields immediately.
+                paginator = fsx_client.get_paginator('describe_file_systems')
+                result = paginator.paginate().build_full_result()
+                return [
+                    {
+                        'filesystem_id': fs['FileSystemId'],
+                        'filesystem_type': fs['FileSystemType'],
+                        'region': region,
+                        'creation_time': fs.get('CreationTime', ''),
+                        'lifecycle': fs.get('Lifecycle', '')
+                    }
+                    for fs in result.get('FileSystems', [])
+                ]
+
+            fsx_client = None
+            try:
+                fsx_client = session.client('fsx', region_name=region, config=self._botocore_config)
+                region_systems = self._with_backoff(_collect)
+
+            except ClientError as e:
+                if e.response['Error']['Code'] not in ['AccessDenied', 'UnauthorizedOperation']:
+                    self._print(f"  ⚠ Error querying FSX in {region}: {e.response['Error']['Code']}")
+                return []
+
+            finally:
+                # These clients are created per account per region; without
+                # an explicit close their pooled connections linger in
+                # CLOSE_WAIT and a multi-thousand-account scan can exhaust
+                # the process file-descriptor limit.
+                if fsx_client is not None:
+                    fsx_client.close()
+
+            return region_systems
 
         fsx_systems = []
 
-        for region in self.govcloud_regions:
-            try:
-                fsx_client = session.client('fsx', region_name=region)
+        # The two GovCloud regions have no data dependency, so query them
+        # concurrently to roughly halve per-account enumeration latency.
+        with ThreadPoolExecutor(max_workers=len(self.govcloud_regions)) as executor:
+            futures = {
+                executor.submit(_list_region, region): region
+                for region in self.govcloud_regions
+            }
 
-                paginator = fsx_client.get_paginator('describe_file_systems')
-                for page in paginator.paginate():
-                    for fs in page.get('FileSystems', []):
-                        fsx_systems.append({
-                            'filesystem_id': fs['FileSystemId'],
-                            'filesystem_type': fs['FileSystemType'],
-                            'region': region,
-                            'creation_time': fs.get('CreationTime', ''),
-                            'lifecycle': fs.get('Lifecycle', '')
-                        })
-
-                if fsx_systems:
-                    print(f"  ✓ Found {len(fsx_systems)} FSX system(s) in {region}")
+            for future in as_completed(futures):
+                region = futures[future]
+                region_systems = future.result()
 
-            except ClientError as e:
-                if e.response['Error']['Code'] not in ['AccessDenied', 'UnauthorizedOperation']:
-                    print(f"  ⚠ Error querying FSX in {region}: {e.response['Error']['Code']}")
-                continue
+                if region_systems:
+                    self._print(f"  ✓ Found {len(region_systems)} FSX system(s) in {region}")
+
+                fsx_systems.extend(region_systems)
 
         return fsx_systems
 
-    def scan_accounts(self, accounts):
+    def _scan_one(self, account):
         """
-        Scan all accounts for FSX file systems.
+        Scan a single account for FSX file systems.
+
+        Runs inside a worker thread; each call creates its own boto3 session
+        via assume_role, so no session state is shared between threads.
+
+        Args:
+            account: Account dictionary
+
+        Returns:
+            list: List of FSX inventory result rows for this account
+        """
+        account_id = account['id']
+        account_name = account['name']
+
+        self._print(f"\n  Processing: {account_name} ({account_id})")
+
+        # Try to assume role in the account
+        assumed_session = self.assume_role(account_id)
+
+        if not assumed_session:
+            # If we can't assume role, try with current credentials
+            # (in case it's the current account)
+            if not self.dry_run:
+                assumed_session = self.session
+            else:
+                self._print(f"  ⚠ [DRY-RUN] Would skip account {account_id}")
+                return []
+
+        # List FSX file systems
+        fsx_systems = self.list_fsx_systems(assumed_session, account)
+
+        if not fsx_systems:
+            self._print(f"  ℹ No FSX file systems found in {account_name}")
+            return []
+
+        # Tuples in CSV_FIELDNAMES order; csv.writer's tuple path skips
+        # DictWriter's per-row field lookup and validation.
+        return [
+            (
+                account_name,
+                account_id,
+                fsx['filesystem_id'],
+                fsx['filesystem_type'],
+                fsx['region'],
+                fsx['lifecycle']
+            )
+            for fsx in fsx_systems
+        ]
+
+    def scan_accounts(self, accounts, csvfile=None):
+        """
+        Scan all accounts for FSX file systems concurrently.
+
+        The work is I/O-bound (STS and FSX API round-trips), so accounts are
+        fanned out across a thread pool. boto3 is thread-safe as long as each
+        thread uses its own Session, which _scan_one guarantees.
+
+        When a csvfile is supplied, rows are written (and flushed) as each
+        account completes, so memory stays bounded regardless of org size
+        and partial results survive an interrupted run.
 
         Args:
             accounts: List of account dictionaries
+            csvfile: Open output file to stream rows to (None in dry-run),
+                flushed after each account
 
         Returns:
-            list: List of FSX inventory results
+            int: Number of FSX inventory rows found
         """
         print(f"\n→ Scanning accounts for FSX file systems...")
-        results = []
+        count = 0
+
+        if self.executor == 'process':
+            # Each subprocess builds its own boto3 session, so credential
+            # refreshes never race; cap the pool since processes cost more
+            # than threads.
+            pool = ProcessPoolExecutor(max_workers=min(self.max_workers, 8))
+            submit = lambda account: pool.submit(
+                _scan_account_process, account,
+                self.profile_name, self.dry_run, self.role_name
+            )
+        else:
+            pool = ThreadPoolExecutor(max_workers=self.max_workers)
+            submit = lambda account: pool.submit(self._scan_one, account)
+
+        with pool:
+            futures = {submit(account): account for account in accounts}
+
+            for future in as_completed(futures):
+                account = futures[future]
+                try:
+                    rows = future.result()
+                except Exception as e:
+                    self._print(f"  ⚠ Error scanning account {account['id']}: {e}")
+                    continue
+
+                if csvfile and rows:
+                    self._write_rows(csvfile, rows)
+                    csvfile.flush()
+                count += len(rows)
 
-        for account in accounts:
-            account_id = account['id']
-            account_name = account['name']
+        return count
 
-            print(f"\n  Processing: {account_name} ({account_id})")
+    async def _scan_one_async(self, aio_session, account, semaphore):
+        """
+        Async counterpart of _scan_one, for --async mode.
 
-            # Try to assume role in the account
-            assumed_session = self.assume_role(account_id)
+        Args:
+            aio_session: Shared aioboto3.Session for the management account
+            account: Account dictionary
+            semaphore: asyncio.Semaphore bounding in-flight accounts
 
-            if not assumed_session:
-                # If we can't assume role, try with current credentials
-                # (in case it's the current account)
-                if not self.dry_run:
-                    try:
-                        assumed_session = self.session
-                    except:
-                        print(f"  ⚠ Skipping account {account_id}")
-                        continue
-                else:
-                    print(f"  ⚠ [DRY-RUN] Would skip account {account_id}")
-                    continue
+        Returns:
+            list: List of FSX inventory result rows for this account
+        """
+        account_id = account['id']
+        account_name = account['name']
 
-            # List FSX file systems
-            fsx_systems = self.list_fsx_systems(assumed_session, account)
-
-            if fsx_systems:
-                for fsx in fsx_systems:
-                    results.append({
-                        'Organization Name': account_name,
-                        'GovCloud Account ID': account_id,
-                        'FSX ID': fsx['filesystem_id'],
-                        'FSX Type': fsx['filesystem_type'],
-                        'Region': fsx['region'],
-                        'Lifecycle': fsx['lifecycle']
-                    })
-            else:
-                print(f"  ℹ No FSX file systems found")
+        async with semaphore:
+            self._print(f"\n  Processing: {account_name} ({account_id})")
 
-        return results
+            role_arn = f"arn:aws-us-gov:iam::{account_id}:role/{self.role_name}"
 
-    def export_to_csv(self, results):
+            try:
+                async with aio_session.client('sts', config=self._botocore_config) as sts:
+                    response = await sts.assume_role(
+                        RoleArn=role_arn,
+                        RoleSessionName=f'fsx-inventory-{account_id}'
+                    )
+            except ClientError as e:
+                self._print(f"  ⚠ Cannot assume role in account {account_id}: "
+                            f"{e.response['Error']['Code']}")
+                return []
+
+            credentials = response['Credentials']
+            assumed_session = aioboto3.Session(
+                aws_access_key_id=credentials['AccessKeyId'],
+                aws_secret_access_key=credentials['SecretAccessKey'],
+                aws_session_token=credentials['SessionToken']
+            )
+
+            async def _list_region(region):
+                try:
+                    async with assumed_session.client(
+                            'fsx', region_name=region,
+                            config=self._botocore_config) as fsx_client:
+                        region_systems = []
+                        paginator = fsx_client.get_paginator('describe_file_systems')
+                        async for page in paginator.paginate():
+                            region_systems.extend(
+                                {
+                                    'filesystem_id': fs['FileSystemId'],
+                                    'filesystem_type': fs['FileSystemType'],
+                                    'region': region,
+                                    'creation_time': fs.get('CreationTime', ''),
+                                    'lifecycle': fs.get('Lifecycle', '')
+                                }
+                                for fs in page.get('FileSystems', [])
+                            )
+
+                except ClientError as e:
+                    if e.response['Error']['Code'] not in ['AccessDenied', 'UnauthorizedOperation']:
+                        self._print(f"  ⚠ Error querying FSX in {region}: "
+                                    f"{e.response['Error']['Code']}")
+                    return []
+
+                if region_systems:
+                    self._print(f"  ✓ Found {len(region_systems)} FSX system(s) in {region}")
+                return region_systems
+
+            region_lists = await asyncio.gather(
+                *(_list_region(region) for region in self.govcloud_regions)
+            )
+            fsx_systems = [fs for region_systems in region_lists for fs in region_systems]
+
+            if not fsx_systems:
+                self._print(f"  ℹ No FSX file systems found in {account_name}")
+                return []
+
+            return [
+                (
+                    account_name,
+                    account_id,
+                    fsx['filesystem_id'],
+                    fsx['filesystem_type'],
+                    fsx['region'],
+                    fsx['lifecycle']
+                )
+                for fsx in fsx_systems
+            ]
+
+    async def scan_accounts_async(self, accounts, csvfile=None):
         """
-        Export results to CSV file.
+        Scan all accounts for FSX file systems on a single asyncio loop.
+
+        One event loop can hold far more in-flight requests than a thread
+        pool; the semaphore keeps concurrency bounded so AWS throttling
+        stays manageable. Rows stream to the output file exactly as in the
+        threaded path.
 
         Args:
-            results: List of FSX inventory results
+            accounts: List of account dictionaries
+            csvfile: Open output file to stream rows to (optional),
+                flushed after each account
 
         Returns:
-            str: Output filename
+            int: Number of FSX inventory rows found
         """
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        output_file = f'govcloud_fsx_inventory_{timestamp}.csv'
+        print(f"\n→ Scanning accounts for FSX file systems (async)...")
+        count = 0
 
-        if self.dry_run:
-            print(f"\n→ [DRY-RUN] Would write {len(results)} result(s) to {output_file}")
-            print(f"  [DRY-RUN] CSV columns: Organization Name, GovCloud Account ID, FSX ID, FSX Type, Region, Lifecycle")
-            if results:
-                print(f"\n  [DRY-RUN] Sample data (first 3 rows):")
-                for i, result in enumerate(results[:3], 1):
-                    print(f"    {i}. {result['Organization Name']} | {result['GovCloud Account ID']} | {result['FSX ID']}")
-            return output_file
-
-        if results:
-            print(f"\n→ Writing results to {output_file}...")
-            with open(output_file, 'w', newline='') as csvfile:
-                fieldnames = ['Organization Name', 'GovCloud Account ID', 'FSX ID',
-                             'FSX Type', 'Region', 'Lifecycle']
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
+        aio_session = aioboto3.Session(profile_name=self.profile_name)
+        semaphore = asyncio.Semaphore(min(self.max_workers * 4, 64))
 
-                writer.writeheader()
-                writer.writerows(results)
+        async def _scan_guarded(account):
+            # as_completed discards the task→account mapping, so catch here
+            # where the account is still in scope and failures stay
+            # attributable, matching the threaded consumer loop.
+            try:
+                return await self._scan_one_async(aio_session, account, semaphore)
+            except Exception as e:
+                self._print(f"  ⚠ Error scanning account {account['id']}: {e}")
+                return []
 
-            print(f"✓ Successfully wrote {len(results)} FSX system(s) to {output_file}")
-        else:
-            print("\n⚠ No FSX file systems found in any account")
+        tasks = [_scan_guarded(account) for account in accounts]
+
+        for task in asyncio.as_completed(tasks):
+            rows = await task
+
+            if csvfile and rows:
+                self._write_rows(csvfile, rows)
+                csvfile.flush()
+            count += len(rows)
 
-        return output_file
+        return count
 
     def run(self):
         """
@@ -335,6 +894,11 @@ class GovCloudFSXInventory:
             print("[DRY-RUN MODE - No actual AWS API calls will be made]")
         print("=" * 60)
 
+        if self.use_async and aioboto3 is None:
+            print("ERROR: --async requires the aioboto3 package.")
+            print("  Install it with: pip install aioboto3")
+            sys.exit(1)
+
         if self.profile_name:
             print(f"\n→ Using AWS profile: {self.profile_name}")
         else:
@@ -351,17 +915,65 @@ class GovCloudFSXInventory:
             print("ERROR: No accounts found or accessible")
             sys.exit(1)
 
-        # Scan accounts for FSX systems
-        results = self.scan_accounts(accounts)
+        # Scan accounts for FSX systems, streaming rows to CSV as they arrive
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        output_file = f'govcloud_fsx_inventory_{timestamp}.csv'
+
+        if self.dry_run:
+            count = self.scan_accounts(accounts)
+            print(f"\n→ [DRY-RUN] Would write {count} result(s) to {output_file}")
+            print(f"  [DRY-RUN] CSV columns: {', '.join(self.CSV_FIELDNAMES)}")
+        else:
+            with open(output_file, 'w', newline='') as csvfile:
+                csvfile.write(','.join(self.CSV_FIELDNAMES) + '\r\n')
+                if self.use_async:
+                    count = asyncio.run(self.scan_accounts_async(accounts, csvfile))
+                else:
+                    count = self.scan_accounts(accounts, csvfile)
 
-        # Export to CSV
-        self.export_to_csv(results)
+            if count:
+                print(f"\n✓ Successfully wrote {count} FSX system(s) to {output_file}")
+            else:
+                print("\n⚠ No FSX file systems found in any account")
 
         print("\n" + "=" * 60)
         print("Scan complete!")
         print("=" * 60)
 
 
+def _scan_account_process(account, profile_name, dry_run, role_name):
+    """
+    Scan a single account inside a worker subprocess.
+
+    Module-level so ProcessPoolExecutor can pickle it. Builds a fresh
+    GovCloudFSXInventory (and therefore a fresh boto3 session) per call,
+    giving each subprocess a fully isolated credential chain.
+
+    Args:
+        account: Account dictionary
+        profile_name: AWS CLI profile name to use (optional)
+        dry_run: If True, simulates operations without AWS API calls
+        role_name: IAM role name to assume in target accounts
+
+    Returns:
+        list: List of FSX inventory result rows for this account
+    """
+    inventory = GovCloudFSXInventory(
+        profile_name=profile_name,
+        dry_run=dry_run,
+        role_name=role_name,
+        max_workers=1
+    )
+
+    if not dry_run:
+        inventory.session = boto3.Session(profile_name=profile_name)
+        inventory._sts_client = inventory.session.client(
+            'sts', config=inventory._botocore_config
+        )
+
+    return inventory._scan_one(account)
+
+
 def main():
     """Main execution function."""
     parser = argparse.ArgumentParser(
@@ -395,13 +1007,80 @@ Examples:
         default='OrganizationAccountAccessRole'
     )
 
+    parser.add_argument(
+        '--max-workers',
+        type=int,
+        help='Number of accounts to scan concurrently (default: 16)',
+        default=16
+    )
+
+    parser.add_argument(
+        '--refresh-accounts',
+        action='store_true',
+        help='Ignore the cached account list and refetch it from AWS Organizations'
+    )
+
+    parser.add_argument(
+        '--executor',
+        choices=['thread', 'process'],
+        help='Concurrency model for the account scan; process isolates credential '
+             'handling per subprocess (default: thread)',
+        default='thread'
+    )
+
+    parser.add_argument(
+        '--prewarm-credentials',
+        action='store_true',
+        help='Serialize the first credential resolve of each assumed session '
+             '(works around rare credential-resolver races at high concurrency)'
+    )
+
+    parser.add_argument(
+        '--accounts-source',
+        choices=['api', 'dynamodb', 'file'],
+        help='Where to read the account list from; dynamodb and file fall back '
+             'to the Organizations API when empty (default: api)',
+        default='api'
+    )
+
+    parser.add_argument(
+        '--accounts-table',
+        help='DynamoDB table name for --accounts-source dynamodb (default: cf-cache)',
+        default='cf-cache'
+    )
+
+    parser.add_argument(
+        '--accounts-file',
+        help='JSON or CSV file for --accounts-source file',
+        default=None
+    )
+
+    parser.add_argument(
+        '--async',
+        dest='use_async',
+        action='store_true',
+        help='Scan accounts on an asyncio event loop via aioboto3 instead of '
+             'the thread pool (requires the aioboto3 package)'
+    )
+
     args = parser.parse_args()
 
+    if args.accounts_source == 'file' and not args.accounts_file:
+        parser.error('--accounts-source file requires --accounts-file')
+
     # Create and run inventory
     inventory = GovCloudFSXInventory(
         profile_name=args.profile,
         dry_run=args.dry_run,
-        role_name=args.role_name
+        role_name=args.role_name,
+        max_workers=args.max_workers,
+        refresh_accounts=args.refresh_accounts,
+        executor=args.executor,
+        prewarm_credentials=args.prewarm_credentials,
+        accounts_source=args.accounts_source,
+        accounts_table=args.accounts_table,
+        accounts_file=args.accounts_file,
+        use_async=args.use_async
     )
 
     inventory.run()